@@ -1,23 +1,40 @@
 from __future__ import annotations
 
+import errno
+import json
+import mmap
 import os
+import queue
+import re
+import shutil
+import struct
 import sys
 import threading
-from dataclasses import dataclass
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
 from enum import Enum
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
 
 from PyQt6.QtCore import (
     QAbstractTableModel,
     QModelIndex,
     QObject,
     QSettings,
+    QStandardPaths,
+    QRunnable,
     Qt,
     QThread,
+    QThreadPool,
     pyqtSignal,
 )
-from PyQt6.QtGui import QColor, QFont, QIcon, QPalette, QStandardItem, QStandardItemModel
+from PyQt6.QtGui import QColor, QFont, QIcon, QPalette
 from PyQt6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -49,8 +66,10 @@ from PyQt6.QtWidgets import (
 # --- Optional deps (graceful) ---
 try:
     import cv2  # type: ignore
+    import numpy as np  # type: ignore  # ships with opencv-python
 except Exception:
     cv2 = None
+    np = None
 
 try:
     from send2trash import send2trash  # type: ignore
@@ -64,6 +83,12 @@ except Exception:
     pythoncom = None
     win32com = None
 
+try:
+    from win32com.propsys import propsys, pscon  # type: ignore
+except Exception:
+    propsys = None
+    pscon = None
+
 
 # =========================
 # App Identity
@@ -73,83 +98,64 @@ APP_ORG = "TimTools"
 APP_SETTINGS = "MediaFlow_BusinessClean"
 
 
+@lru_cache(maxsize=None)
 def resource_path(relative: str) -> str:
     """
     PyInstaller-friendly asset loader:
-    - dev: relative path from cwd
+    - dev: relative to this script (assets are required for the theme)
     - onefile: from sys._MEIPASS
     """
     base = getattr(sys, "_MEIPASS", None)
     if base:
         return str(Path(base) / relative)
-    return str(Path(relative))
+    return str(Path(__file__).resolve().parent / relative)
 
 
 # =========================
 # Theme (Business Dark)
 # =========================
+def load_asset_text(relative: str) -> str:
+    try:
+        return Path(resource_path(relative)).read_text(encoding="utf-8")
+    except OSError:
+        return ""
+
+
+# Read once at import; re-applying the theme reuses the string.
+_BUSINESS_DARK_QSS = load_asset_text("assets/business_dark.qss")
+
+
+# QColor is a plain value type (no QApplication needed), so build these once.
+_BUSINESS_DARK_COLORS = (
+    (QPalette.ColorRole.Window, QColor(24, 24, 24)),
+    (QPalette.ColorRole.WindowText, QColor(235, 235, 235)),
+    (QPalette.ColorRole.Base, QColor(18, 18, 18)),
+    (QPalette.ColorRole.AlternateBase, QColor(28, 28, 28)),
+    (QPalette.ColorRole.Text, QColor(235, 235, 235)),
+    (QPalette.ColorRole.Button, QColor(42, 42, 42)),
+    (QPalette.ColorRole.ButtonText, QColor(235, 235, 235)),
+    (QPalette.ColorRole.Highlight, QColor(90, 90, 90)),
+    (QPalette.ColorRole.HighlightedText, QColor(255, 255, 255)),
+)
+
+
 def apply_business_dark(app: QApplication) -> None:
     pal = QPalette()
-    pal.setColor(QPalette.ColorRole.Window, QColor(24, 24, 24))
-    pal.setColor(QPalette.ColorRole.WindowText, QColor(235, 235, 235))
-    pal.setColor(QPalette.ColorRole.Base, QColor(18, 18, 18))
-    pal.setColor(QPalette.ColorRole.AlternateBase, QColor(28, 28, 28))
-    pal.setColor(QPalette.ColorRole.Text, QColor(235, 235, 235))
-    pal.setColor(QPalette.ColorRole.Button, QColor(42, 42, 42))
-    pal.setColor(QPalette.ColorRole.ButtonText, QColor(235, 235, 235))
-    pal.setColor(QPalette.ColorRole.Highlight, QColor(90, 90, 90))
-    pal.setColor(QPalette.ColorRole.HighlightedText, QColor(255, 255, 255))
+    for role, color in _BUSINESS_DARK_COLORS:
+        pal.setColor(role, color)
     app.setPalette(pal)
 
-    app.setStyleSheet(
-        """
-        QWidget { font-size: 10pt; }
-        QGroupBox { font-weight: 600; }
-        QLineEdit, QTableView, QProgressBar, QTreeWidget, QComboBox, QDoubleSpinBox, QSpinBox {
-            border: 1px solid #3a3a3a;
-            border-radius: 8px;
-        }
-        QLineEdit, QComboBox, QDoubleSpinBox, QSpinBox { padding: 6px; }
-        QHeaderView::section {
-            background: #2a2a2a;
-            border: 1px solid #3a3a3a;
-            padding: 6px;
-            font-weight: 700;
-        }
-        QPushButton, QToolButton {
-            padding: 7px 12px;
-            border: 1px solid #3a3a3a;
-            border-radius: 8px;
-            background: #2b2b2b;
-            font-weight: 650;
-        }
-        QPushButton:hover, QToolButton:hover { border: 1px solid #5a5a5a; background: #303030; }
-        QPushButton:pressed, QToolButton:pressed { background: #262626; }
-        QPushButton:disabled, QToolButton:disabled { color: #9a9a9a; background: #242424; border: 1px solid #2f2f2f; }
-        QProgressBar { text-align: center; }
-        QProgressBar::chunk { background-color: #6a6a6a; }
-        QToolTip {
-            color: #f0f0f0;
-            background-color: #202020;
-            border: 1px solid #4a4a4a;
-            padding: 6px;
-        }
-        QListWidget {
-            border: 1px solid #3a3a3a;
-            border-radius: 10px;
-            padding: 6px;
-        }
-        """
-    )
+    app.setStyleSheet(_BUSINESS_DARK_QSS)
 
 
 # =========================
 # Shared helpers
 # =========================
+_FOLDER_TRANS = str.maketrans({"/": "_", "\\": "_"})
+
+
 def sanitize_folder_name(name: str) -> str:
-    name = (name or "").strip()
-    name = name.replace("/", "_").replace("\\", "_").replace("..", "_")
-    return name
+    return (name or "").strip().translate(_FOLDER_TRANS).replace("..", "_")
 
 
 def compute_output_root(source_dir: Path, output_name: str) -> Path:
@@ -157,57 +163,237 @@ def compute_output_root(source_dir: Path, output_name: str) -> Path:
     return source_dir if out == "" else (source_dir / out)
 
 
-def is_under(path: Path, root: Path) -> bool:
-    try:
-        path.relative_to(root)
-        return True
-    except ValueError:
-        return False
+# (full path, file name, lower-case extension incl. dot) -- produced once per file by the walker
+FileEntry = Tuple[str, str, str]
 
 
-def enumerate_files(source_dir: Path, recursive: bool, exclude_dirs: List[Path]) -> List[Path]:
-    def allowed(p: Path) -> bool:
-        for ex in exclude_dirs:
-            if is_under(p, ex):
-                return False
-        return True
+def _iter_entries(
+    root: str,
+    recursive: bool,
+    exclude_set: FrozenSet[str] = frozenset(),
+    dirs_out: Optional[List[str]] = None,
+) -> Iterator[FileEntry]:
+    """
+    Yields files below root. DirEntry caches the type from the directory listing,
+    so there is no extra stat() per entry. Folders whose normcase'd absolute path
+    is in exclude_set are never opened. When not recursive, subfolders are
+    collected into dirs_out (if given) instead of walked.
+    """
+    # Explicit stack instead of nested generators: no frame per directory level.
+    stack = deque([root])
+    while stack:
+        d = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if os.path.normcase(entry.path) in exclude_set:
+                            continue
+                        if recursive:
+                            stack.append(entry.path)
+                        elif dirs_out is not None:
+                            dirs_out.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        name = entry.name
+                        # rfind slice instead of os.path.splitext: no extra calls per file.
+                        dot = name.rfind(".")
+                        yield entry.path, name, name[dot:].lower() if dot > 0 else ""
+        except (PermissionError, FileNotFoundError):
+            continue
 
-    if not recursive:
-        return [p for p in source_dir.iterdir() if p.is_file() and allowed(p)]
 
-    out: List[Path] = []
-    for p in source_dir.rglob("*"):
-        if not p.is_file():
-            continue
-        if allowed(p):
-            out.append(p)
+def _list_entries(root: str, exclude_set: FrozenSet[str]) -> List[FileEntry]:
+    return list(_iter_entries(root, True, exclude_set))
+
+
+def enumerate_files(source_dir: Path, recursive: bool, exclude_set: FrozenSet[str] = frozenset()) -> List[FileEntry]:
+    """
+    Returns (path, name, ext) string tuples; callers build a Path only where they
+    need one. exclude_set holds normcase'd absolute folder paths to skip. Order is
+    filesystem order; callers that need a stable order sort on the path string
+    (plain string compare, no PurePath.__lt__).
+    """
+    root = os.path.abspath(str(source_dir))
+
+    if not recursive:
+        return list(_iter_entries(root, False, exclude_set))
+
+    # Top level in this thread; each subfolder tree on a pool thread (scandir releases the GIL).
+    subdirs: List[str] = []
+    out = list(_iter_entries(root, False, exclude_set, subdirs))
+    if subdirs:
+        workers = min(8, os.cpu_count() or 1, len(subdirs))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_list_entries, d, exclude_set) for d in subdirs]
+            out.extend(chain.from_iterable(f.result() for f in futures))
     return out
 
 
-def unique_dest(dest: Path) -> Path:
-    if not dest.exists():
-        return dest
-    stem, ext = dest.stem, dest.suffix
-    parent = dest.parent
-    i = 1
+def dir_names(directory: str) -> Set[str]:
+    """
+    normcase'd names in directory, for syscall-free collision checks. Empty if it
+    does not exist yet or cannot be listed; the move itself then reports the error.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return {os.path.normcase(e.name) for e in it}
+    except OSError:
+        return set()
+
+
+def unique_dest(dest: str, names: Set[str], counters: Dict[str, int]) -> str:
+    """
+    Returns "stem (N).ext" next to dest with the first free N -- no syscalls.
+    `names` is the dir_names() listing of the parent; the chosen name is added to it.
+    `counters` remembers the last N per destination so repeated collisions do not
+    re-probe (1), (2), ... from the start; share one dict per run.
+    """
+    parent, name = os.path.split(dest)
+    stem, ext = os.path.splitext(name)
+    ckey = os.path.normcase(dest)
+    i = counters.get(ckey, 0)
     while True:
-        cand = parent / f"{stem} ({i}){ext}"
-        if not cand.exists():
-            return cand
         i += 1
+        name = f"{stem} ({i}){ext}"
+        key = os.path.normcase(name)
+        if key not in names:
+            names.add(key)
+            counters[ckey] = i
+            return os.path.join(parent, name)
 
 
-def move_file(src: Path, dest: Path, overwrite: bool) -> None:
-    if overwrite and dest.exists() and dest.is_file():
-        dest.unlink()
+def same_device(a: Path, b: Path) -> bool:
+    """True if a and b are on one volume (or that cannot be told), i.e. moves are renames."""
     try:
-        src.rename(dest)
+        return os.stat(a).st_dev == os.stat(b).st_dev
     except OSError:
-        import shutil
+        return True
+
+
+def move_file(src: str, dest: str, overwrite: bool, cross_device: bool = False) -> None:
+    """
+    Moves src to dest with a metadata-only rename when possible. cross_device
+    (see same_device) skips the rename attempt that would only fail with EXDEV.
+    """
+    s, d = os.fspath(src), os.fspath(dest)
+    if not cross_device:
+        try:
+            # os.replace overwrites atomically on POSIX and Windows; os.rename refuses on Windows.
+            if overwrite:
+                os.replace(s, d)
+            else:
+                os.rename(s, d)
+            return
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+
+    # Different volume: copy + delete.
+    if overwrite and os.path.isfile(d):
+        os.unlink(d)
+    shutil.move(s, d)
+
+
+class ProgressThrottle:
+    """
+    Coalesces per-item progress(done, total) emits for cross-thread signals:
+    forwards at most every `interval` seconds or every `max_pending` updates
+    (the sort workers use ~0.5% of the total). Call flush() once at the end
+    so the final count always arrives.
+    """
+
+    def __init__(self, emit: Callable[[int, int], None], interval: float = 0.05, max_pending: int = 500):
+        self._emit = emit
+        self._interval = interval
+        self._max_pending = max_pending
+        self._pending = 0
+        self._last = time.monotonic()
+
+    def update(self, done: int, total: int) -> None:
+        self._pending += 1
+        now = time.monotonic()
+        if self._pending >= self._max_pending or now - self._last >= self._interval:
+            self._emit(done, total)
+            self._pending = 0
+            self._last = now
+
+    def flush(self, done: int, total: int) -> None:
+        self._emit(done, total)
+        self._pending = 0
+        self._last = time.monotonic()
+
+
+def _result_or_error(fut: Future) -> object:
+    try:
+        return fut.result()
+    except Exception as e:
+        return e
+
+
+def bounded_map(
+    pool: ThreadPoolExecutor,
+    fn: Callable[[object], object],
+    items: Iterable[object],
+    window: int,
+    cancelled: Callable[[], bool],
+) -> Iterator[object]:
+    """
+    Executor.map with at most `window` calls in flight, submitting lazily as results
+    are consumed and stopping once cancelled() is true. Results come back in input
+    order; a call that raised yields its exception instead, so one bad file does
+    not end the batch.
+    """
+    pending: deque = deque()
+    for item in items:
+        if cancelled():
+            break
+        pending.append(pool.submit(fn, item))
+        if len(pending) >= window:
+            yield _result_or_error(pending.popleft())
+    while pending:
+        yield _result_or_error(pending.popleft())
+
+
+def background_iter(source: Iterable[object], maxsize: int = 1000) -> Iterator[object]:
+    """
+    Runs `source` on a daemon thread and yields its items through a bounded queue,
+    so a slow producer (a directory walk) overlaps with the consumer. An exception
+    in the producer is re-raised here; closing the generator stops the producer.
+    """
+    q: queue.Queue = queue.Queue(maxsize)
+    stop = threading.Event()
+    end = object()
+    error: List[BaseException] = []
+
+    def put(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
 
-        if overwrite and dest.exists() and dest.is_file():
-            dest.unlink()
-        shutil.move(str(src), str(dest))
+    def produce() -> None:
+        try:
+            for item in source:
+                if not put(item):
+                    return
+        except BaseException as e:
+            error.append(e)
+        put(end)
+
+    threading.Thread(target=produce, name="background_iter", daemon=True).start()
+    try:
+        while True:
+            item = q.get()
+            if item is end:
+                if error:
+                    raise error[0]
+                return
+            yield item
+    finally:
+        stop.set()
 
 
 # =========================
@@ -231,18 +417,150 @@ SUPPORTED_VIDEO_EXT_TYPE = {
 # For ORIENTATION we keep a practical subset where cv2 is most likely to work.
 SUPPORTED_IMAGE_EXT_ORIENT = {".jpg", ".jpeg", ".png", ".bmp", ".tif", ".tiff", ".webp"}
 SUPPORTED_VIDEO_EXT_ORIENT = {".mp4", ".mov", ".m4v", ".mkv", ".avi", ".wmv", ".webm", ".mpg", ".mpeg"}
+SUPPORTED_EXT_ORIENT = frozenset(SUPPORTED_IMAGE_EXT_ORIENT | SUPPORTED_VIDEO_EXT_ORIENT)
 
 
-def classify_type(p: Path) -> Optional[str]:
-    ext = p.suffix.lower()
-    if ext in SUPPORTED_IMAGE_EXT_TYPE:
-        return "image"
-    if ext in SUPPORTED_VIDEO_EXT_TYPE:
-        return "video"
+# ext -> kind in one lookup (images win if a suffix were ever in both sets)
+TYPE_KINDS: Dict[str, str] = {
+    **{ext: "video" for ext in SUPPORTED_VIDEO_EXT_TYPE},
+    **{ext: "image" for ext in SUPPORTED_IMAGE_EXT_TYPE},
+}
+
+
+_PROBE_BYTES = 64 * 1024
+
+# JPEG SOFn markers (C4 = DHT, C8 = JPG, CC = DAC are not frame headers)
+_JPEG_SOF = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _tiff_tags(buf, base: int, end: int, wanted: Set[int]) -> Dict[int, int]:
+    """
+    Reads SHORT/LONG values of the wanted tags from IFD0 of a TIFF structure
+    starting at base (a TIFF file, or the payload of a JPEG Exif segment).
+    """
+    order = bytes(buf[base:base + 2])
+    if order == b"II":
+        e = "<"
+    elif order == b"MM":
+        e = ">"
+    else:
+        return {}
+    ifd = base + struct.unpack_from(e + "I", buf, base + 4)[0]
+    if ifd + 2 > end:
+        return {}
+    count = struct.unpack_from(e + "H", buf, ifd)[0]
+    out: Dict[int, int] = {}
+    pos = ifd + 2
+    for _ in range(count):
+        if pos + 12 > end:
+            break
+        tag, typ = struct.unpack_from(e + "HH", buf, pos)
+        if tag in wanted:
+            if typ == 3:
+                out[tag] = struct.unpack_from(e + "H", buf, pos + 8)[0]
+            elif typ == 4:
+                out[tag] = struct.unpack_from(e + "I", buf, pos + 8)[0]
+        pos += 12
+    return out
+
+
+def _jpeg_size(buf, n: int) -> Optional[Tuple[int, int]]:
+    i = 2
+    orientation = 1
+    while i + 4 <= n:
+        if buf[i] != 0xFF:
+            return None
+        marker = buf[i + 1]
+        if marker == 0xFF:  # fill byte
+            i += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:  # standalone markers
+            i += 2
+            continue
+        if marker == 0xDA:  # start of scan without a frame header
+            return None
+        length = struct.unpack_from(">H", buf, i + 2)[0]
+        if marker in _JPEG_SOF:
+            if i + 9 > n:
+                return None
+            h, w = struct.unpack_from(">HH", buf, i + 5)
+            # cv2 applies the Exif rotation, so a rotated phone photo keeps its bucket.
+            return (h, w) if orientation >= 5 else (w, h)
+        if marker == 0xE1 and bytes(buf[i + 4:i + 10]) == b"Exif\0\0":
+            end = min(n, i + 2 + length)
+            orientation = _tiff_tags(buf, i + 10, end, {0x0112}).get(0x0112, 1)
+        i += 2 + length
     return None
 
 
-def classify_dimensions(p: Path) -> Tuple[str, int, int]:
+def _parse_dimensions(buf, n: int) -> Optional[Tuple[int, int]]:
+    if n >= 4 and buf[0] == 0xFF and buf[1] == 0xD8:
+        return _jpeg_size(buf, n)
+    if n >= 24 and bytes(buf[:8]) == b"\x89PNG\r\n\x1a\n" and bytes(buf[12:16]) == b"IHDR":
+        return struct.unpack_from(">II", buf, 16)
+    if n >= 26 and bytes(buf[:2]) == b"BM":
+        # BITMAPINFOHEADER and later; negative height = top-down rows
+        if struct.unpack_from("<I", buf, 14)[0] >= 40:
+            w, h = struct.unpack_from("<ii", buf, 18)
+            return w, abs(h)
+        return None
+    if n >= 8 and bytes(buf[:4]) in (b"II*\0", b"MM\0*"):
+        tags = _tiff_tags(buf, 0, n, {0x0100, 0x0101})
+        if 0x0100 in tags and 0x0101 in tags:
+            return tags[0x0100], tags[0x0101]
+        return None
+    if n >= 30 and bytes(buf[:4]) == b"RIFF" and bytes(buf[8:12]) == b"WEBP":
+        chunk = bytes(buf[12:16])
+        if chunk == b"VP8 ":
+            w, h = struct.unpack_from("<HH", buf, 26)
+            return w & 0x3FFF, h & 0x3FFF
+        if chunk == b"VP8L" and buf[20] == 0x2F:
+            bits = struct.unpack_from("<I", buf, 21)[0]
+            return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+        if chunk == b"VP8X":
+            w = int.from_bytes(buf[24:27], "little") + 1
+            h = int.from_bytes(buf[27:30], "little") + 1
+            return w, h
+    return None
+
+
+def _probe_dimensions(path: str) -> Optional[Tuple[int, int]]:
+    """
+    Reads (width, height) from the image header without decoding pixels.
+    Returns None for unknown formats or headers beyond the first 64 KB.
+    """
+    try:
+        with open(path, "rb") as f:
+            n = min(os.fstat(f.fileno()).st_size, _PROBE_BYTES)
+            if n == 0:
+                return None
+            with mmap.mmap(f.fileno(), n, access=mmap.ACCESS_READ) as m:
+                size = _parse_dimensions(m, n)
+    except (OSError, ValueError, struct.error):
+        return None
+    if size is None or size[0] <= 0 or size[1] <= 0:
+        return None
+    return size
+
+
+@contextmanager
+def _video_capture(path: str) -> Iterator:
+    """
+    Opens a capture for property reads only (no frames are read) and always
+    releases it; lingering captures keep their decoder buffers alive.
+    FFmpeg answers width/height from the container; other backends are a fallback.
+    """
+    cap = cv2.VideoCapture(path, cv2.CAP_FFMPEG)
+    if not cap.isOpened():
+        cap.release()
+        cap = cv2.VideoCapture(path)
+    try:
+        yield cap
+    finally:
+        cap.release()
+
+
+def classify_dimensions(path: str) -> Tuple[str, int, int]:
     """
     Returns: (kind, width, height)
     kind: image|video
@@ -250,23 +568,34 @@ def classify_dimensions(p: Path) -> Tuple[str, int, int]:
     if cv2 is None:
         raise RuntimeError("OpenCV (cv2) not installed. Orientation mode requires opencv-python.")
 
-    ext = p.suffix.lower()
+    ext = os.path.splitext(path)[1].lower()
 
     if ext in SUPPORTED_VIDEO_EXT_ORIENT:
-        cap = cv2.VideoCapture(str(p))
-        try:
+        with _video_capture(path) as cap:
             if not cap.isOpened():
                 raise RuntimeError("Could not open video.")
             w = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
             h = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            if (w <= 0 or h <= 0) and cap.grab():
+                # Some containers report the size only after the first frame; grab()
+                # skips the color conversion + copy that read() would do.
+                w = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+                h = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
             if w <= 0 or h <= 0:
                 raise RuntimeError(f"Invalid video dimensions: {w}x{h}")
             return "video", w, h
-        finally:
-            cap.release()
 
     if ext in SUPPORTED_IMAGE_EXT_ORIENT:
-        im = cv2.imread(str(p))
+        size = _probe_dimensions(path)
+        if size is not None:
+            return "image", size[0], size[1]
+
+        # Fallback: imdecode from bytes (also copes with non-ASCII paths on Windows).
+        # Full-size decode: the header probe already covers the common case, and a
+        # reduced decode would misreport the size and can flip near-square buckets.
+        with open(path, "rb") as f:
+            buf = np.frombuffer(f.read(), np.uint8)
+        im = cv2.imdecode(buf, cv2.IMREAD_COLOR)
         if im is None:
             raise RuntimeError("Could not read image.")
         h, w = im.shape[:2]
@@ -281,7 +610,7 @@ def orientation_bucket(w: int, h: int) -> str:
     return "portrait" if (w / h) < 1 else "landscape"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SortConfig:
     source_dir: Path
     output_name: str
@@ -293,18 +622,48 @@ class SortConfig:
     sort_mode: SortMode
 
 
-@dataclass(frozen=True)
+# SortPreviewItem.status_code; codes up to STATUS_OK_OVERWRITE are executable.
+STATUS_OK = 0
+STATUS_OK_OVERWRITE = 1
+STATUS_SKIP_DUPLICATE = 2
+STATUS_ERROR = 3
+
+
+def _resolve_dest(
+    dest_dir: str, names: Set[str], out_name: str, dup_mode: str, counters: Dict[str, int]
+) -> Tuple[str, str, int]:
+    """
+    Applies dup_mode to out_name in dest_dir and returns (dest, status, status_code).
+    `names` is the dir_names() set of dest_dir and is updated with the chosen name;
+    `counters` is the per-run unique_dest() dict. Skips return the colliding path.
+    """
+    dest = dest_dir + os.sep + out_name
+    key = os.path.normcase(out_name)
+    if key not in names:
+        names.add(key)
+        return dest, "OK", STATUS_OK
+    if dup_mode == "skip":
+        return dest, "SKIP (duplicate)", STATUS_SKIP_DUPLICATE
+    if dup_mode == "auto_rename":
+        return unique_dest(dest, names, counters), "OK", STATUS_OK
+    if dup_mode == "overwrite":
+        return dest, "OK (overwrite)", STATUS_OK_OVERWRITE
+    return dest, "OK", STATUS_OK
+
+
+@dataclass(frozen=True, slots=True)
 class SortPreviewItem:
-    src: Path
+    src: str
     kind: str                 # image | video | ?
     width: int                # 0 if n/a
     height: int               # 0 if n/a
     bucket: str               # portrait|landscape|Images|Videos|?
-    dest: Path
+    dest: str                 # "-" if n/a
     status: str               # OK | SKIP.. | ERROR..
+    status_code: int          # STATUS_*
 
 
-@dataclass
+@dataclass(slots=True)
 class SortStats:
     found: int = 0
     supported: int = 0
@@ -318,20 +677,89 @@ class SortStats:
     moved: int = 0
 
 
+def output_dirs(cfg: SortConfig, output_root: Path) -> Tuple[Path, Path]:
+    if cfg.sort_mode == SortMode.ORIENTATION:
+        return output_root / "portrait", output_root / "landscape"
+    return output_root / "Images", output_root / "Videos"
+
+
+def ensure_output_dirs(cfg: SortConfig, output_root: Path) -> Tuple[Path, Path]:
+    """output_dirs(), created on disk unless this is a dry run."""
+    a, b = output_dirs(cfg, output_root)
+    if not cfg.dry_run:
+        for d in (a, b):
+            if not os.path.isdir(d):
+                d.mkdir(parents=True, exist_ok=True)
+    return a, b
+
+
 class SortPreviewModel(QAbstractTableModel):
     HEADERS = ["File", "Type", "WxH", "Bucket", "Destination", "Status"]
 
+    _C_ERR = QColor(220, 130, 130)
+    _C_SKIP = QColor(170, 170, 170)
+    _C_OK = QColor(200, 200, 200)
+    _STATUS_COLORS = (_C_OK, _C_OK, _C_SKIP, _C_ERR)  # indexed by STATUS_*
+
     def __init__(self) -> None:
         super().__init__()
+        # Column-wise storage, pre-formatted at ingest so data() is a plain index.
         self._items: List[SortPreviewItem] = []
+        self._cols: Tuple[List[str], ...] = tuple([] for _ in self.HEADERS)
+        self._status_codes: List[int] = []
+
+    def _ingest(self, items: List[SortPreviewItem]) -> None:
+        names, kinds, sizes, buckets, dests, statuses = self._cols
+        basename, dirname = os.path.basename, os.path.dirname
+        self._items.extend(items)
+        names.extend(basename(it.src) for it in items)
+        kinds.extend(it.kind for it in items)
+        sizes.extend("-" if it.width <= 0 or it.height <= 0 else f"{it.width}x{it.height}" for it in items)
+        buckets.extend(it.bucket for it in items)
+        dests.extend("-" if it.dest == "-" else f"{basename(dirname(it.dest))}\\{basename(it.dest)}" for it in items)
+        statuses.extend(it.status for it in items)
+        self._status_codes.extend(it.status_code for it in items)
 
     def set_items(self, items: List[SortPreviewItem]) -> None:
         self.beginResetModel()
-        self._items = items
+        self._items = []
+        self._cols = tuple([] for _ in self.HEADERS)
+        self._status_codes = []
+        self._ingest(items)
         self.endResetModel()
 
+    def append_rows(self, items: List[SortPreviewItem]) -> None:
+        """Appends a batch streamed in by the analyzer without resetting the view."""
+        if not items:
+            return
+        first = len(self._items)
+        self.beginInsertRows(QModelIndex(), first, first + len(items) - 1)
+        self._ingest(items)
+        self.endInsertRows()
+
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
-        return 0 if parent.isValid() else len(self._items)
+        return 0 if parent.isValid() else len(self._status_codes)
+
+    _SORT_KEYS = (
+        lambda it: os.path.basename(it.src).casefold(),
+        lambda it: it.kind,
+        lambda it: (it.width, it.height),
+        lambda it: it.bucket,
+        lambda it: it.dest.casefold(),
+        lambda it: it.status,
+    )
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        # One keyed list sort + one reset instead of per-row moves.
+        if not 0 <= column < len(self._SORT_KEYS):
+            return
+        keys = list(map(self._SORT_KEYS[column], self._items))
+        perm = sorted(range(len(keys)), key=keys.__getitem__, reverse=(order == Qt.SortOrder.DescendingOrder))
+        self.beginResetModel()
+        self._items = [self._items[i] for i in perm]
+        self._cols = tuple([col[i] for i in perm] for col in self._cols)
+        self._status_codes = [self._status_codes[i] for i in perm]
+        self.endResetModel()
 
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
         return 0 if parent.isValid() else len(self.HEADERS)
@@ -347,128 +775,183 @@ class SortPreviewModel(QAbstractTableModel):
         if not index.isValid():
             return None
 
-        it = self._items[index.row()]
-        col = index.column()
-
         if role == Qt.ItemDataRole.DisplayRole:
-            if col == 0:
-                return it.src.name
-            if col == 1:
-                return it.kind
-            if col == 2:
-                return "-" if it.width <= 0 or it.height <= 0 else f"{it.width}x{it.height}"
-            if col == 3:
-                return it.bucket
-            if col == 4:
-                return "-" if str(it.dest) == "-" else f"{it.dest.parent.name}\\{it.dest.name}"
-            if col == 5:
-                return it.status
-
-        if role == Qt.ItemDataRole.ForegroundRole and col == 5:
-            if it.status.startswith("ERROR"):
-                return QColor(220, 130, 130)
-            if it.status.startswith("SKIP"):
-                return QColor(170, 170, 170)
-            return QColor(200, 200, 200)
+            return self._cols[index.column()][index.row()]
+
+        if role == Qt.ItemDataRole.ForegroundRole and index.column() == 5:
+            return self._STATUS_COLORS[self._status_codes[index.row()]]
 
         return None
 
 
-class SortAnalyzerWorker(QObject):
+class _SignalBus(QObject):
+    """Signals for a sort QRunnable (which is not a QObject itself)."""
+
     progress = pyqtSignal(int, int)
-    finished = pyqtSignal(list, object)
+    chunk_ready = pyqtSignal(list)  # analyzer: preview rows in batches, ahead of finished
+    finished = pyqtSignal(object)   # SortStats
     failed = pyqtSignal(str)
 
+
+class SortAnalyzerWorker(QRunnable):
+    CHUNK_SIZE = 500
+
     def __init__(self, cfg: SortConfig, cancel_event: threading.Event):
         super().__init__()
+        self.setAutoDelete(False)  # the page holds the reference until finished/failed
+        self.bus = _SignalBus()
         self.cfg = cfg
         self.cancel_event = cancel_event
 
-    def _ensure_output_dirs(self, output_root: Path) -> Tuple[Path, Path]:
-        if self.cfg.sort_mode == SortMode.ORIENTATION:
-            a = output_root / "portrait"
-            b = output_root / "landscape"
-        else:
-            a = output_root / "Images"
-            b = output_root / "Videos"
-        a.mkdir(parents=True, exist_ok=True)
-        b.mkdir(parents=True, exist_ok=True)
-        return a, b
-
     def run(self) -> None:
+        # A QRunnable has no other way to report: anything uncaught would leave the page busy.
+        try:
+            self._run()
+        except Exception as e:
+            self.bus.failed.emit(str(e))
+
+    def _run(self) -> None:
         src = self.cfg.source_dir
         if not src.exists() or not src.is_dir():
-            self.failed.emit("Source does not exist or is not a folder.")
+            self.bus.failed.emit("Source does not exist or is not a folder.")
             return
 
         out_root = compute_output_root(src, self.cfg.output_name)
-        dir_a, dir_b = self._ensure_output_dirs(out_root)
+        dir_a, dir_b = output_dirs(self.cfg, out_root)  # preview only; created on Execute
 
-        exclude_dirs: List[Path] = []
-        if out_root != src:
-            exclude_dirs.append(out_root)
-        exclude_dirs.append(dir_a)
-        exclude_dirs.append(dir_b)
+        exclude_set = frozenset(
+            os.path.normcase(os.path.abspath(d)) for d in (out_root, dir_a, dir_b) if d != src
+        )
 
-        files = enumerate_files(src, self.cfg.recursive, exclude_dirs)
+        files = enumerate_files(src, self.cfg.recursive, exclude_set)
+        files.sort(key=itemgetter(0))  # stable preview order across runs
         stats = SortStats(found=len(files))
         preview: List[SortPreviewItem] = []
+        dir_a_s, dir_b_s = str(dir_a), str(dir_b)
+        # Existing names in both targets, updated as names are handed out.
+        targets = (dir_a_s, dir_names(dir_a_s), dir_b_s, dir_names(dir_b_s))
 
-        self.progress.emit(0, stats.found)
-        done = 0
+        found = stats.found
+        self.bus.progress.emit(0, found)
+        progress = ProgressThrottle(self.bus.progress.emit, max_pending=max(1, found // 200))
 
-        for p in files:
-            if self.cancel_event.is_set():
+        # The mode is fixed for the run: one specialised loop each instead of a per-file branch.
+        if self.cfg.sort_mode == SortMode.TYPE:
+            done = self._run_type(files, stats, preview, targets, progress.update)
+        else:
+            done = self._run_orientation(files, stats, preview, targets, progress.update)
+
+        progress.flush(done, found)
+        self.bus.finished.emit(stats)
+
+    def _run_type(
+        self,
+        files: List[FileEntry],
+        stats: SortStats,
+        preview: List[SortPreviewItem],
+        targets: Tuple[str, Set[str], str, Set[str]],
+        update: Callable[[int, int], None],
+    ) -> int:
+        dir_a, names_a, dir_b, names_b = targets
+        dup = self.cfg.dup_mode
+        name_fn = str.lower if self.cfg.lowercase else str  # str() of a str is the identity
+        cancelled = self.cancel_event.is_set
+        resolve = _resolve_dest
+        rename_counters: Dict[str, int] = {}
+        found = stats.found
+        done = 0
+        emit_chunk = self.bus.chunk_ready.emit
+        chunk_size = self.CHUNK_SIZE
+        sent = 0
+
+        # Everything a supported file needs, resolved by a single dict lookup on its extension.
+        per_kind = {"image": 0, "video": 0}
+        targets_by_kind = {"image": ("Images", dir_a, names_a), "video": ("Videos", dir_b, names_b)}
+        routes = {ext: (kind, *targets_by_kind[kind]) for ext, kind in TYPE_KINDS.items()}
+        route_for = routes.get
+
+        for path, name, ext in files:
+            if cancelled():
                 break
+            if len(preview) - sent >= chunk_size:
+                emit_chunk(preview[sent:])
+                sent = len(preview)
 
             try:
-                if self.cfg.sort_mode == SortMode.TYPE:
-                    kind = classify_type(p)
-                    if kind is None:
-                        stats.skipped_unsupported += 1
-                        done += 1
-                        self.progress.emit(done, stats.found)
-                        continue
+                route = route_for(ext)
+                if route is None:
+                    stats.skipped_unsupported += 1
+                    done += 1
+                    update(done, found)
+                    continue
 
-                    stats.supported += 1
-                    if kind == "image":
-                        stats.images += 1
-                        bucket = "Images"
-                        dest_dir = dir_a
-                    else:
-                        stats.videos += 1
-                        bucket = "Videos"
-                        dest_dir = dir_b
+                kind, bucket, dest_dir, names = route
+                per_kind[kind] += 1
+
+                dest, status, code = resolve(dest_dir, names, name_fn(name), dup, rename_counters)
+                if code == STATUS_SKIP_DUPLICATE:
+                    stats.skipped_duplicates += 1
+                preview.append(SortPreviewItem(path, kind, 0, 0, bucket, dest, status, code))
 
-                    out_name = p.name.lower() if self.cfg.lowercase else p.name
-                    dest = dest_dir / out_name
+            except Exception as e:
+                stats.errors += 1
+                preview.append(SortPreviewItem(path, "?", 0, 0, "?", "-", f"ERROR: {e}", STATUS_ERROR))
 
-                    if dest.exists():
-                        if self.cfg.dup_mode == "skip":
-                            stats.skipped_duplicates += 1
-                            preview.append(SortPreviewItem(p, kind, 0, 0, bucket, dest, "SKIP (duplicate)"))
-                            done += 1
-                            self.progress.emit(done, stats.found)
-                            continue
-                        if self.cfg.dup_mode == "auto_rename":
-                            dest = unique_dest(dest)
+            done += 1
+            update(done, found)
+
+        stats.images, stats.videos = per_kind["image"], per_kind["video"]
+        stats.supported = stats.images + stats.videos
+        if len(preview) > sent:
+            emit_chunk(preview[sent:])
+        return done
+
+    def _run_orientation(
+        self,
+        files: List[FileEntry],
+        stats: SortStats,
+        preview: List[SortPreviewItem],
+        targets: Tuple[str, Set[str], str, Set[str]],
+        update: Callable[[int, int], None],
+    ) -> int:
+        dir_a, names_a, dir_b, names_b = targets
+        dup = self.cfg.dup_mode
+        name_fn = str.lower if self.cfg.lowercase else str
+        cancelled = self.cancel_event.is_set
+        resolve = _resolve_dest
+        rename_counters: Dict[str, int] = {}
+        found = stats.found
+        done = 0
+        emit_chunk = self.bus.chunk_ready.emit
+        chunk_size = self.CHUNK_SIZE
+        sent = 0
 
-                    status = "OK"
-                    if self.cfg.dup_mode == "overwrite" and (dest_dir / out_name).exists():
-                        status = "OK (overwrite)"
+        # Probe dimensions on a pool (decode releases the GIL); results come back in
+        # file order and are consumed below as the loop reaches each file.
+        probe_paths = [path for path, _, ext in files if ext in SUPPORTED_EXT_ORIENT]
+        workers = os.cpu_count() or 1
+        pool = ThreadPoolExecutor(max_workers=workers)  # threads start on first submit
+        probes = bounded_map(pool, classify_dimensions, probe_paths, workers * 4, cancelled)
 
-                    preview.append(SortPreviewItem(p, kind, 0, 0, bucket, dest, status))
+        try:
+            for path, name, ext in files:
+                if cancelled():
+                    break
+                if len(preview) - sent >= chunk_size:
+                    emit_chunk(preview[sent:])
+                    sent = len(preview)
 
-                else:
-                    # ORIENTATION
-                    ext = p.suffix.lower()
-                    if ext not in SUPPORTED_IMAGE_EXT_ORIENT and ext not in SUPPORTED_VIDEO_EXT_ORIENT:
+                try:
+                    if ext not in SUPPORTED_EXT_ORIENT:
                         stats.skipped_unsupported += 1
                         done += 1
-                        self.progress.emit(done, stats.found)
+                        update(done, found)
                         continue
 
-                    kind, w, h = classify_dimensions(p)
+                    probe = next(probes)
+                    if isinstance(probe, Exception):
+                        raise probe
+                    kind, w, h = probe
                     stats.supported += 1
 
                     if kind == "image":
@@ -480,117 +963,154 @@ class SortAnalyzerWorker(QObject):
                     if bucket == "portrait":
                         stats.portrait += 1
                         dest_dir = dir_a
+                        names = names_a
                     else:
                         stats.landscape += 1
                         dest_dir = dir_b
+                        names = names_b
 
-                    out_name = p.name.lower() if self.cfg.lowercase else p.name
-                    dest = dest_dir / out_name
-
-                    if dest.exists():
-                        if self.cfg.dup_mode == "skip":
-                            stats.skipped_duplicates += 1
-                            preview.append(SortPreviewItem(p, kind, w, h, bucket, dest, "SKIP (duplicate)"))
-                            done += 1
-                            self.progress.emit(done, stats.found)
-                            continue
-                        if self.cfg.dup_mode == "auto_rename":
-                            dest = unique_dest(dest)
-
-                    status = "OK"
-                    if self.cfg.dup_mode == "overwrite" and (dest_dir / out_name).exists():
-                        status = "OK (overwrite)"
-
-                    preview.append(SortPreviewItem(p, kind, w, h, bucket, dest, status))
+                    dest, status, code = resolve(dest_dir, names, name_fn(name), dup, rename_counters)
+                    if code == STATUS_SKIP_DUPLICATE:
+                        stats.skipped_duplicates += 1
+                    preview.append(SortPreviewItem(path, kind, w, h, bucket, dest, status, code))
 
-            except Exception as e:
-                stats.errors += 1
-                preview.append(SortPreviewItem(p, "?", 0, 0, "?", Path("-"), f"ERROR: {e}"))
-
-            done += 1
-            self.progress.emit(done, stats.found)
+                except Exception as e:
+                    stats.errors += 1
+                    preview.append(SortPreviewItem(path, "?", 0, 0, "?", "-", f"ERROR: {e}", STATUS_ERROR))
 
-        self.finished.emit(preview, stats)
+                done += 1
+                update(done, found)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
 
+        if len(preview) > sent:
+            emit_chunk(preview[sent:])
+        return done
 
-class SortExecuteWorker(QObject):
-    progress = pyqtSignal(int, int)
-    finished = pyqtSignal(object)
-    failed = pyqtSignal(str)
 
+class SortExecuteWorker(QRunnable):
     def __init__(self, cfg: SortConfig, items: List[SortPreviewItem], cancel_event: threading.Event):
         super().__init__()
+        self.setAutoDelete(False)
+        self.bus = _SignalBus()
         self.cfg = cfg
         self.items = items
         self.cancel_event = cancel_event
 
-    def _ensure_output_dirs(self, output_root: Path) -> Tuple[Path, Path]:
-        if self.cfg.sort_mode == SortMode.ORIENTATION:
-            a = output_root / "portrait"
-            b = output_root / "landscape"
-        else:
-            a = output_root / "Images"
-            b = output_root / "Videos"
-        a.mkdir(parents=True, exist_ok=True)
-        b.mkdir(parents=True, exist_ok=True)
-        return a, b
-
     def run(self) -> None:
-        ok_items = [x for x in self.items if x.status.startswith("OK")]
+        try:
+            self._run()
+        except Exception as e:
+            self.bus.failed.emit(str(e))
+
+    def _run(self) -> None:
+        ok_items = [x for x in self.items if x.status_code <= STATUS_OK_OVERWRITE]
         if not ok_items:
-            self.failed.emit("No executable items. Run Analyze first.")
+            self.bus.failed.emit("No executable items. Run Analyze first.")
             return
 
         src = self.cfg.source_dir
         out_root = compute_output_root(src, self.cfg.output_name)
-        dir_a, dir_b = self._ensure_output_dirs(out_root)
+        dir_a, dir_b = (str(d) for d in ensure_output_dirs(self.cfg, out_root))
 
         total = len(ok_items)
         stats = SortStats()
-        self.progress.emit(0, total)
-
-        moved = 0
+        names_a, names_b = dir_names(dir_a), dir_names(dir_b)
+        normcase, basename = os.path.normcase, os.path.basename
+        rename_counters: Dict[str, int] = {}
+
+        # Loop invariants as locals
+        bucket_a = "portrait" if self.cfg.sort_mode == SortMode.ORIENTATION else "Images"
+        dup = self.cfg.dup_mode
+        name_fn = str.lower if self.cfg.lowercase else str
+        dry_run = self.cfg.dry_run
+        overwrite = dup == "overwrite"
+        cancelled = self.cancel_event.is_set
+        # Checked once: on one volume every move is a rename, otherwise a copy + delete.
+        cross_device = not dry_run and not same_device(src, out_root)
+
+        self.bus.progress.emit(0, total)
+        progress = ProgressThrottle(self.bus.progress.emit, max_pending=max(1, total // 200))
+        update = progress.update
+
+        # Destination names are resolved up front, in preview order, on this thread.
+        jobs: List[Tuple[str, str]] = []
         for it in ok_items:
-            if self.cancel_event.is_set():
+            if cancelled():
                 break
 
-            if self.cfg.sort_mode == SortMode.ORIENTATION:
-                dest_dir = dir_a if it.bucket == "portrait" else dir_b
+            if it.bucket == bucket_a:
+                dest_dir, names = dir_a, names_a
             else:
-                dest_dir = dir_a if it.bucket == "Images" else dir_b
-
-            out_name = it.src.name.lower() if self.cfg.lowercase else it.src.name
-            dest = dest_dir / out_name
-
-            if dest.exists():
-                if self.cfg.dup_mode == "skip":
-                    stats.skipped_duplicates += 1
-                    continue
-                if self.cfg.dup_mode == "auto_rename":
-                    dest = unique_dest(dest)
+                dest_dir, names = dir_b, names_b
+            dest, _, code = _resolve_dest(dest_dir, names, name_fn(basename(it.src)), dup, rename_counters)
+            if code == STATUS_SKIP_DUPLICATE:
+                stats.skipped_duplicates += 1
+                continue
+            jobs.append((it.src, dest))
+
+        def move_job(job: Tuple[str, str]) -> None:
+            move_file(job[0], job[1], overwrite=overwrite, cross_device=cross_device)
+
+        def move_group(group: List[Tuple[str, str]]) -> int:
+            # Jobs sharing a destination (overwrite mode) run in preview order on one thread.
+            failed = 0
+            for job in group:
+                try:
+                    move_job(job)
+                except Exception:
+                    failed += 1
+            return failed
 
-            if not self.cfg.dry_run:
+        moved = 0
+        if dry_run:
+            moved = len(jobs)
+        elif cross_device:
+            # Copy + delete is I/O bound: a few files in flight keep both volumes busy.
+            groups: Dict[str, List[Tuple[str, str]]] = {}
+            for job in jobs:
+                groups.setdefault(normcase(job[1]), []).append(job)
+            group_list = list(groups.values())
+            workers = min(4, os.cpu_count() or 1)
+            pool = ThreadPoolExecutor(max_workers=workers)
+            try:
+                results = bounded_map(pool, move_group, group_list, workers * 2, cancelled)
+                for group, failed in zip(group_list, results):
+                    if isinstance(failed, Exception):
+                        failed = len(group)
+                    stats.errors += failed
+                    moved += len(group) - failed
+                    update(moved, total)
+            finally:
+                pool.shutdown(wait=True, cancel_futures=True)
+        else:
+            for job in jobs:
+                if cancelled():
+                    break
                 try:
-                    move_file(it.src, dest, overwrite=(self.cfg.dup_mode == "overwrite"))
+                    move_job(job)
                 except Exception:
                     stats.errors += 1
                     continue
+                moved += 1
+                update(moved, total)
 
-            moved += 1
-            stats.moved = moved
-            self.progress.emit(moved, total)
-
-        self.finished.emit(stats)
+        stats.moved = moved
+        progress.flush(moved, total)
+        self.bus.finished.emit(stats)
 
 
 class SortMediaPage(QWidget):
-    def __init__(self, settings: QSettings):
+    def __init__(self, settings: QSettings, config: AppConfig):
         super().__init__()
         self.settings = settings
+        self.config = config
+        self._written = config.group("sort")
         self.cancel_event = threading.Event()
 
-        self.thread: Optional[QThread] = None
-        self.worker: Optional[QObject] = None
+        # Workers run on the global QThreadPool; the page only tracks whether one is active.
+        self._running = False
+        self.worker: Optional[QRunnable] = None
 
         self.preview_items: List[SortPreviewItem] = []
         self.preview_cfg: Optional[SortConfig] = None
@@ -783,27 +1303,26 @@ class SortMediaPage(QWidget):
         self._set_stats(SortStats())
 
     def _on_any_change(self) -> None:
-        if self.thread is None:
+        if not self._running:
             self._invalidate_preview()
         self._save()
         self._update_tree()
         self._refresh()
 
     def _load(self) -> None:
-        self.source_edit.setText(self.settings.value("sort/source", "", type=str))
-        self.output_edit.setText(self.settings.value("sort/output", "", type=str))
-        self.cb_dry.setChecked(self.settings.value("sort/dry", False, type=bool))
-        self.cb_lower.setChecked(self.settings.value("sort/lower", True, type=bool))
-        self.cb_recursive.setChecked(self.settings.value("sort/recursive", False, type=bool))
-        self.cb_remember.setChecked(self.settings.value("sort/remember", True, type=bool))
-
-        dup = self.settings.value("sort/dup", "auto_rename", type=str)
-        idx = self.dup_combo.findData(dup)
+        c = self.config
+        self.source_edit.setText(c.sort_source)
+        self.output_edit.setText(c.sort_output)
+        self.cb_dry.setChecked(c.sort_dry)
+        self.cb_lower.setChecked(c.sort_lower)
+        self.cb_recursive.setChecked(c.sort_recursive)
+        self.cb_remember.setChecked(c.sort_remember)
+
+        idx = self.dup_combo.findData(c.sort_dup)
         if idx >= 0:
             self.dup_combo.setCurrentIndex(idx)
 
-        mode = self.settings.value("sort/mode", SortMode.ORIENTATION.value, type=str)
-        if mode == SortMode.TYPE.value:
+        if c.sort_mode == SortMode.TYPE.value:
             self.mode_combo.setCurrentIndex(1)
         else:
             self.mode_combo.setCurrentIndex(0)
@@ -811,14 +1330,16 @@ class SortMediaPage(QWidget):
     def _save(self) -> None:
         if not self.cb_remember.isChecked():
             return
-        self.settings.setValue("sort/source", self.source_edit.text().strip())
-        self.settings.setValue("sort/output", self.output_edit.text())
-        self.settings.setValue("sort/dry", self.cb_dry.isChecked())
-        self.settings.setValue("sort/lower", self.cb_lower.isChecked())
-        self.settings.setValue("sort/recursive", self.cb_recursive.isChecked())
-        self.settings.setValue("sort/remember", self.cb_remember.isChecked())
-        self.settings.setValue("sort/dup", self.dup_combo.currentData())
-        self.settings.setValue("sort/mode", self._mode().value)
+        write_settings_group(self.settings, "sort", {
+            "source": self.source_edit.text().strip(),
+            "output": self.output_edit.text(),
+            "dry": self.cb_dry.isChecked(),
+            "lower": self.cb_lower.isChecked(),
+            "recursive": self.cb_recursive.isChecked(),
+            "remember": self.cb_remember.isChecked(),
+            "dup": str(self.dup_combo.currentData()),
+            "mode": self._mode().value,
+        }, self._written)
 
     def _update_tree(self) -> None:
         self.tree.clear()
@@ -863,7 +1384,7 @@ class SortMediaPage(QWidget):
             )
 
     def _refresh(self) -> None:
-        running = self.thread is not None
+        running = self._running
         has_source_text = bool(self.source_edit.text().strip())
         has_preview = len(self.preview_items) > 0 and self.preview_cfg is not None
 
@@ -894,7 +1415,7 @@ class SortMediaPage(QWidget):
                 QDesktopServices.openUrl(QUrl.fromLocalFile(str(p)))
 
     def _analyze(self) -> None:
-        if self.thread is not None:
+        if self._running:
             return
 
         cfg = self._cfg()
@@ -914,25 +1435,12 @@ class SortMediaPage(QWidget):
         self.model.set_items([])
         self._set_stats(SortStats())
 
-        self.cancel_event.clear()
-        self.thread = QThread()
-        self.worker = SortAnalyzerWorker(cfg, self.cancel_event)
-        self.worker.moveToThread(self.thread)
-
-        self.thread.started.connect(self.worker.run)
-        self.worker.progress.connect(self._on_progress)
-        self.worker.failed.connect(self._on_failed)
-        self.worker.finished.connect(self._on_analyze_finished)
-
-        self.worker.finished.connect(self.thread.quit)
-        self.worker.failed.connect(self.thread.quit)
-        self.thread.finished.connect(self._cleanup)
-
-        self.thread.start()
-        self._refresh()
+        worker = SortAnalyzerWorker(cfg, self.cancel_event)
+        worker.bus.chunk_ready.connect(self._on_preview_chunk, Qt.ConnectionType.QueuedConnection)
+        self._start(worker, self._on_analyze_finished)
 
     def _execute(self) -> None:
-        if self.thread is not None:
+        if self._running:
             return
         if not self.preview_items or self.preview_cfg is None:
             return
@@ -953,25 +1461,27 @@ class SortMediaPage(QWidget):
 
         self.progress.setValue(0)
 
-        self.cancel_event.clear()
-        self.thread = QThread()
-        self.worker = SortExecuteWorker(cfg, self.preview_items, self.cancel_event)
-        self.worker.moveToThread(self.thread)
-
-        self.thread.started.connect(self.worker.run)
-        self.worker.progress.connect(self._on_progress)
-        self.worker.failed.connect(self._on_failed)
-        self.worker.finished.connect(self._on_execute_finished)
+        self._start(SortExecuteWorker(cfg, self.preview_items, self.cancel_event), self._on_execute_finished)
 
-        self.worker.finished.connect(self.thread.quit)
-        self.worker.failed.connect(self.thread.quit)
-        self.thread.finished.connect(self._cleanup)
+    def _start(self, worker: QRunnable, on_finished: Callable[[object], None]) -> None:
+        bus = worker.bus
+        bus.progress.connect(self._on_progress)
+        bus.failed.connect(self._on_failed)
+        bus.finished.connect(on_finished)
+        bus.finished.connect(self._cleanup)
+        bus.failed.connect(self._cleanup)
 
-        self.thread.start()
+        self.cancel_event.clear()
+        self.worker = worker
+        self._running = True
+        QThreadPool.globalInstance().start(worker)
         self._refresh()
 
+    def is_running(self) -> bool:
+        return self._running
+
     def _cancel(self) -> None:
-        if self.thread is None:
+        if not self._running:
             return
         self.cancel_event.set()
 
@@ -984,10 +1494,13 @@ class SortMediaPage(QWidget):
     def _on_failed(self, msg: str) -> None:
         QMessageBox.critical(self, "Error", msg)
 
-    def _on_analyze_finished(self, preview: list, stats: object) -> None:
-        self.preview_items = list(preview)
+    def _on_preview_chunk(self, items: list) -> None:
+        self.preview_items.extend(items)
+        self.model.append_rows(items)
+
+    def _on_analyze_finished(self, stats: object) -> None:
+        # The rows already arrived through chunk_ready.
         self.preview_cfg = self._cfg()
-        self.model.set_items(self.preview_items)
         self.table.resizeColumnsToContents()
         if isinstance(stats, SortStats):
             self._set_stats(stats)
@@ -1000,8 +1513,8 @@ class SortMediaPage(QWidget):
             QMessageBox.information(self, "Dry-run", "Dry-run finished. No files were moved.")
         self._refresh()
 
-    def _cleanup(self) -> None:
-        self.thread = None
+    def _cleanup(self, *_: object) -> None:
+        self._running = False
         self.worker = None
         self._refresh()
 
@@ -1033,11 +1546,12 @@ class ActionMode(str, Enum):
 
 @dataclass(frozen=True)
 class CleanerSettings:
-    directory: Path
+    directory: str
     recursive: bool
     threshold_seconds: float
     extensions: Set[str]
     action: ActionMode
+    size_fastpath_mbps: float = 0.0  # > 0: keep files too big to be short at this bitrate, unprobed
 
 
 @dataclass
@@ -1064,7 +1578,19 @@ def parse_extensions(text: str) -> Set[str]:
     return out
 
 
-def iter_files_fast(root: Path, recursive: bool):
+def iter_files_fast(root: str, recursive: bool, exts: FrozenSet[str]) -> Iterator[Tuple[str, os.stat_result]]:
+    """
+    Yields (path, stat) for files whose extension (lower-case, no dot) is in exts.
+    The name test runs first, so is_file()/stat() are only asked of candidates;
+    on Windows both come from the directory listing without extra syscalls.
+    Deliberately not os.walk: it only hands back names, so every candidate
+    would need a separate os.stat() for the duration cache and size shortcut.
+    """
+    if not exts:
+        return
+    # One compiled, case-insensitive match on the raw name instead of slicing
+    # and lower-casing a copy of every suffix.
+    match_ext = re.compile(r"\.(?:" + "|".join(map(re.escape, sorted(exts))) + r")\Z", re.IGNORECASE).search
     stack = [root]
     while stack:
         cur = stack.pop()
@@ -1072,42 +1598,181 @@ def iter_files_fast(root: Path, recursive: bool):
             with os.scandir(cur) as it:
                 for e in it:
                     try:
-                        if e.is_dir(follow_symlinks=False):
-                            if recursive:
-                                stack.append(Path(e.path))
-                        elif e.is_file(follow_symlinks=False):
-                            yield Path(e.path)
+                        if match_ext(e.name) and e.is_file(follow_symlinks=False):
+                            yield e.path, e.stat(follow_symlinks=False)
+                        elif recursive and e.is_dir(follow_symlinks=False):
+                            stack.append(e.path)
                     except OSError:
                         continue
         except OSError:
             continue
 
 
+def _mp4_boxes(f, start: int, end: int) -> Iterator[Tuple[bytes, int, int]]:
+    """Yields (type, payload offset, box end) for the ISO-BMFF boxes in [start, end)."""
+    pos = start
+    while pos + 8 <= end:
+        f.seek(pos)
+        hdr = f.read(8)
+        if len(hdr) < 8:
+            return
+        size, typ = struct.unpack(">I4s", hdr)
+        hlen = 8
+        if size == 1:
+            large = f.read(8)
+            if len(large) < 8:
+                return
+            size = struct.unpack(">Q", large)[0]
+            hlen = 16
+        elif size == 0:
+            size = end - pos
+        if size < hlen:
+            return
+        yield typ, pos + hlen, pos + size
+        pos += size
+
+
+def mp4_duration(path: str) -> Optional[float]:
+    """
+    Duration from the moov/mvhd box of an MP4/MOV file -- a few small reads, no COM.
+    Top-level boxes (mdat included) are skipped by seeking. None if not found.
+    """
+    try:
+        with open(path, "rb") as f:
+            end = os.fstat(f.fileno()).st_size
+            for typ, body, box_end in _mp4_boxes(f, 0, end):
+                if typ != b"moov":
+                    continue
+                for ctyp, cbody, _ in _mp4_boxes(f, body, box_end):
+                    if ctyp != b"mvhd":
+                        continue
+                    f.seek(cbody)
+                    data = f.read(32)
+                    if data[:1] == b"\x01":
+                        timescale, duration = struct.unpack_from(">IQ", data, 20)
+                        unknown = 0xFFFFFFFFFFFFFFFF
+                    else:
+                        timescale, duration = struct.unpack_from(">II", data, 12)
+                        unknown = 0xFFFFFFFF
+                    if timescale == 0 or duration in (0, unknown):
+                        return None
+                    return duration / timescale
+                return None
+    except (OSError, struct.error):
+        return None
+    return None
+
+
+_EBML_HEAD = 0x1A45DFA3
+_MKV_SEGMENT = 0x18538067
+_MKV_INFO = 0x1549A966
+_MKV_TIMECODE_SCALE = 0x2AD7B1
+_MKV_DURATION = 0x4489
+_MKV_HEAD_BYTES = 16 * 1024
+
+
+def _ebml_vint(buf: bytes, pos: int, keep_marker: bool) -> Tuple[int, int]:
+    """Decodes an EBML variable-length integer at pos; returns (value, next pos)."""
+    first = buf[pos]
+    if first == 0:
+        raise ValueError("invalid EBML vint")
+    length = 9 - first.bit_length()
+    if pos + length > len(buf):
+        raise IndexError("truncated EBML vint")
+    value = first if keep_marker else first & (0xFF >> length)
+    for b in buf[pos + 1:pos + length]:
+        value = (value << 8) | b
+    return value, pos + length
+
+
+def _ebml_element(buf: bytes, pos: int) -> Tuple[int, int, Optional[int]]:
+    """Returns (id, payload pos, payload size); size is None for 'unknown'."""
+    eid, pos = _ebml_vint(buf, pos, True)
+    size, end = _ebml_vint(buf, pos, False)
+    if size == (1 << (7 * (end - pos))) - 1:
+        return eid, end, None
+    return eid, end, size
+
+
+def mkv_duration(path: str) -> Optional[float]:
+    """
+    Duration from Segment/Info of a Matroska/WebM file, parsed from the first 16 KB.
+    None if the header does not carry a Duration element within that window.
+    """
+    try:
+        with open(path, "rb") as f:
+            buf = f.read(_MKV_HEAD_BYTES)
+        eid, pos, size = _ebml_element(buf, 0)
+        if eid != _EBML_HEAD or size is None:
+            return None
+        eid, pos, size = _ebml_element(buf, pos + size)
+        if eid != _MKV_SEGMENT:
+            return None
+        end = len(buf) if size is None else min(len(buf), pos + size)
+        while pos < end:
+            eid, pos, size = _ebml_element(buf, pos)
+            if eid == _MKV_INFO:
+                info_end = end if size is None else min(end, pos + size)
+                scale, duration = 1_000_000, None
+                while pos < info_end:
+                    eid, pos, size = _ebml_element(buf, pos)
+                    if size is None:
+                        return None
+                    data = buf[pos:pos + size]
+                    if eid == _MKV_TIMECODE_SCALE:
+                        scale = int.from_bytes(data, "big")
+                    elif eid == _MKV_DURATION:
+                        duration = struct.unpack(">f" if size == 4 else ">d", data)[0]
+                    pos += size
+                if not duration or duration < 0:
+                    return None
+                return duration * scale / 1e9
+            if size is None:
+                return None
+            pos += size
+    except (OSError, IndexError, ValueError, struct.error):
+        return None
+    return None
+
+
+# Container header parsers tried before COM, keyed by lowercase extension.
+DURATION_PARSERS: Dict[str, Callable[[str], Optional[float]]] = {
+    ".mp4": mp4_duration,
+    ".mov": mp4_duration,
+    ".m4v": mp4_duration,
+    ".3gp": mp4_duration,
+    ".3g2": mp4_duration,
+    ".mkv": mkv_duration,
+    ".webm": mkv_duration,
+}
+
+
 class WindowsDurationReader:
+    """
+    Reads System.Media.Duration through the file's IPropertyStore: one call per file,
+    no folder namespace round-trip. Falls back to Shell.Application if propsys is missing.
+    """
+
+    FOLDER_CACHE_SIZE = 128
+
     def __init__(self) -> None:
         if not sys.platform.startswith("win"):
             raise RuntimeError("Short Video Cleaner is Windows-only.")
         if pythoncom is None or win32com is None:
             raise RuntimeError("Missing dependency: pywin32. Install: py -m pip install pywin32")
 
-        self._shell = win32com.client.Dispatch("Shell.Application")
-        self._folder_cache = {}
-
-    def duration_seconds(self, file_path: Path) -> Optional[float]:
-        folder_path = str(file_path.parent)
-        folder = self._folder_cache.get(folder_path)
-        if folder is None:
-            folder = self._shell.NameSpace(folder_path)
-            self._folder_cache[folder_path] = folder
-        if folder is None:
-            return None
-
-        item = folder.ParseName(file_path.name)
-        if item is None:
-            return None
+        self._shell = None
+        self._folder_cache: OrderedDict[str, object] = OrderedDict()  # LRU of Folder proxies
+        if propsys is None:
+            self._shell = win32com.client.Dispatch("Shell.Application")
 
+    def duration_seconds(self, file_path: str) -> Optional[float]:
         try:
-            v = item.ExtendedProperty("System.Media.Duration")
+            if self._shell is None:
+                store = propsys.SHGetPropertyStoreFromParsingName(file_path)
+                v = store.GetValue(pscon.PKEY_Media_Duration).GetValue()
+            else:
+                v = self._shell_duration(file_path)
             if v is None:
                 return None
             ticks_100ns = int(v)
@@ -1117,32 +1782,223 @@ class WindowsDurationReader:
         except Exception:
             return None
 
+    def _shell_duration(self, file_path: str) -> object:
+        folder_path, name = os.path.split(file_path)
+        cache = self._folder_cache
+        if folder_path in cache:
+            cache.move_to_end(folder_path)
+            folder = cache[folder_path]
+        else:
+            folder = self._shell.NameSpace(folder_path)
+            cache[folder_path] = folder
+            if len(cache) > self.FOLDER_CACHE_SIZE:
+                cache.popitem(last=False)  # drops the proxy, releasing its IShellFolder
+        if folder is None:
+            return None
+
+        item = folder.ParseName(name)
+        if item is None:
+            return None
+        return item.ExtendedProperty("System.Media.Duration")
+
+
+class DurationCache:
+    """
+    Durations keyed by path and validated against (st_mtime_ns, st_size), so an
+    edited file is probed again. Persisted as JSON in the app data folder; only
+    known durations are stored. Safe to query from pool threads (plain dict ops);
+    save() and clear() are serialized and save() writes a snapshot.
+    """
+
+    MAX_ENTRIES = 200_000
+
+    def __init__(self, path: str):
+        self._path = path
+        self._data: Dict[str, list] = {}
+        self._loaded = False
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def default_path() -> str:
+        base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)
+        return os.path.join(base, "duration_cache.json")
+
+    def load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                # Drop malformed entries here so get() can trust the shape.
+                self._data = {k: v for k, v in data.items() if self._valid_entry(v)}
+                self._dirty = len(self._data) != len(data)
+        except (OSError, ValueError):
+            self._data = {}
+
+    @staticmethod
+    def _valid_entry(entry: object) -> bool:
+        # [mtime_ns, size, duration]
+        return (
+            isinstance(entry, list)
+            and len(entry) == 3
+            and type(entry[0]) is int
+            and type(entry[1]) is int
+            and type(entry[2]) in (int, float)
+        )
+
+    def get(self, path: str, st: os.stat_result) -> Optional[float]:
+        hit = self._data.get(os.path.normcase(path))
+        if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+            return hit[2]
+        return None
+
+    def put(self, path: str, st: os.stat_result, duration: float) -> None:
+        self._data[os.path.normcase(path)] = [st.st_mtime_ns, st.st_size, duration]
+        self._dirty = True
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            # Snapshot: other threads may still put() while this writes.
+            data = dict(self._data)
+            self._dirty = False
+            if len(data) > self.MAX_ENTRIES:
+                # Insertion order: keep the most recently probed entries.
+                keys = list(data)
+                data = {k: data[k] for k in keys[-self.MAX_ENTRIES:]}
+                self._data = data
+            try:
+                os.makedirs(os.path.dirname(self._path), exist_ok=True)
+                tmp = self._path + ".tmp"
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(data, f, separators=(",", ":"))
+                os.replace(tmp, self._path)
+            except OSError:
+                self._dirty = True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data = {}
+            self._loaded = True
+            self._dirty = False
+            try:
+                os.remove(self._path)
+            except OSError:
+                pass
+
+
+_probe_local = threading.local()
+
+
+def _init_probe_thread() -> None:
+    pythoncom.CoInitialize()
+
+
+def _shutdown_probe_pool(pool: ThreadPoolExecutor, workers: int) -> None:
+    """
+    Balances _init_probe_thread before the pool goes away: one task per worker
+    thread (the barrier stops a thread from taking two) drops that thread's
+    reader and calls CoUninitialize. Threads that were never started are
+    spawned, initialized and uninitialized by these tasks, which keeps it even.
+    """
+    barrier = threading.Barrier(workers)
+    done: Set[int] = set()
+
+    def uninit() -> None:
+        try:
+            barrier.wait(timeout=10)
+        except threading.BrokenBarrierError:
+            pass  # a thread stuck in a COM call; the rest still clean up once each
+        ident = threading.get_ident()
+        if ident in done:
+            return
+        done.add(ident)
+        _probe_local.reader = None  # release the Shell/property objects first
+        pythoncom.CoUninitialize()
+
+    for fut in [pool.submit(uninit) for _ in range(workers)]:
+        fut.exception()
+    pool.shutdown(wait=True, cancel_futures=True)
+
+
+# COM probes per pool thread between message pumps.
+PROBE_PUMP_EVERY = 1000
+
+
+def probe_duration(file_path: str) -> Optional[float]:
+    """duration_seconds() on a pool thread, with one reader (COM apartment) per thread."""
+    reader = getattr(_probe_local, "reader", None)
+    if reader is None:
+        reader = _probe_local.reader = WindowsDurationReader()
+        _probe_local.calls = 0
+    _probe_local.calls += 1
+    if _probe_local.calls % PROBE_PUMP_EVERY == 0:
+        # Pool threads never run a message loop; drain the apartment's queue so
+        # pending COM releases and callbacks don't pile up on long scans.
+        pythoncom.PumpWaitingMessages()
+    return reader.duration_seconds(file_path)
+
 
 class CleanerWorker(QObject):
+    # Rows (and the stats snapshot with them) go out in batches, not per file.
+    ROW_BATCH = 100
+    ROW_INTERVAL = 0.1
+
     progress = pyqtSignal(int, int)
     status = pyqtSignal(str)
-    stats = pyqtSignal(object)
-    row = pyqtSignal(object)  # (status, duration, filename, fullpath)
-    finished = pyqtSignal(object)
+    stats = pyqtSignal(int, int, int, int, int, int, int)  # CleanerStats fields, in order
+    row_batch = pyqtSignal(list)  # [(status, duration, fullpath), ...]
+    finished = pyqtSignal()
     failed = pyqtSignal(str)
 
-    def __init__(self, settings: CleanerSettings):
+    def __init__(self, settings: CleanerSettings, cache: DurationCache):
         super().__init__()
         self.s = settings
-        self._cancel = False
+        self.cache = cache
+        self._cancel = threading.Event()
+        self._keep_size: Optional[float] = None
 
     def cancel(self) -> None:
-        self._cancel = True
-
-    def _delete(self, p: Path) -> None:
+        self._cancel.set()
+
+    def _probe(self, entry: Tuple[str, os.stat_result]) -> Optional[float]:
+        # Runs on the probe pool.
+        path, st = entry
+        if self._cancel.is_set():
+            return None  # queued before Cancel; run() stops before using it
+        if self._keep_size is not None and st.st_size >= self._keep_size:
+            return None  # size shortcut; run() marks it KEEP
+        dur = self.cache.get(path, st)
+        if dur is None:
+            parser = DURATION_PARSERS.get(os.path.splitext(path)[1].lower())
+            if parser is not None:
+                dur = parser(path)
+            if dur is None:
+                dur = probe_duration(path)
+            if dur is not None:
+                self.cache.put(path, st, dur)
+        return dur
+
+    def _emit_stats(self, st: CleanerStats) -> None:
+        # Plain ints: a snapshot the GUI thread can read while the worker keeps counting.
+        self.stats.emit(st.found, st.scanned, st.short, st.deleted, st.kept, st.unknown, st.errors)
+
+    def _delete(self, p: str) -> None:
         if self.s.action == ActionMode.ANALYZE:
             return
         if self.s.action == ActionMode.RECYCLE:
             if send2trash is None:
                 raise RuntimeError("send2trash not installed")
-            send2trash(str(p))  # type: ignore[misc]
+            send2trash(p)  # type: ignore[misc]
             return
-        p.unlink(missing_ok=True)
+        try:
+            os.unlink(p)
+        except FileNotFoundError:
+            pass
 
     def run(self) -> None:
         try:
@@ -1152,72 +2008,201 @@ class CleanerWorker(QObject):
                 raise RuntimeError("pywin32 is missing. Install: py -m pip install pywin32")
 
             pythoncom.CoInitialize()
+            pool: Optional[ThreadPoolExecutor] = None
+            workers = os.cpu_count() or 1
+            discovered: Optional[Iterator] = None
             try:
-                reader = WindowsDurationReader()
+                WindowsDurationReader()  # fail early on a broken COM setup
                 exts = self.s.extensions
 
-                files: List[Path] = []
-                for f in iter_files_fast(self.s.directory, self.s.recursive):
-                    ext = f.suffix.lower().lstrip(".")
-                    if ext in exts:
-                        files.append(f)
+                st = CleanerStats()
+                self._emit_stats(st)
+                self.status.emit("Scanning...")
+
+                # Property handlers block on disk: overlap them across threads, results in file order.
+                pool = ThreadPoolExecutor(max_workers=workers, initializer=_init_probe_thread)
+                self.cache.load()
+
+                # Size shortcut: below the threshold a file this big would need more than
+                # size_fastpath_mbps, so it is a KEEP without a probe (1 Mbit/s = 125 000 B/s).
+                mbps = self.s.size_fastpath_mbps
+                self._keep_size = keep_size = self.s.threshold_seconds * mbps * 125_000 if mbps > 0 else None
 
-                st = CleanerStats(found=len(files))
-                self.stats.emit(st)
+                # The walk runs on its own thread and streams into the probe pool, so probing
+                # starts with the first folder. It yields folder by folder, which keeps each
+                # probe thread's Shell folder cache hot.
+                discovered = background_iter(iter_files_fast(self.s.directory, self.s.recursive, frozenset(exts)))
+                entries: deque = deque()
 
-                total = len(files)
-                self.status.emit(f"Found {total} files")
+                def feed() -> Iterator[Tuple[str, os.stat_result]]:
+                    for entry in discovered:
+                        st.found += 1
+                        entries.append(entry)
+                        yield entry
 
-                for i, p in enumerate(files, start=1):
-                    if self._cancel:
-                        self.status.emit("Canceled")
+                durations = bounded_map(pool, self._probe, feed(), workers * 4, self._cancel.is_set)
+
+                progress = ProgressThrottle(self.progress.emit)
+                batch: List[tuple] = []
+                last_flush = time.monotonic()
+
+                for i, dur in enumerate(durations, start=1):
+                    if self._cancel.is_set():
                         break
+                    p, fst = entries.popleft()
 
                     st.scanned += 1
-                    dur = reader.duration_seconds(p)
-
-                    if dur is None:
-                        st.unknown += 1
-                        self.row.emit(("UNKNOWN", None, p.name, str(p)))
+                    if keep_size is not None and fst.st_size >= keep_size:
+                        st.kept += 1
+                        status = "KEEP"
                     else:
-                        if dur < self.s.threshold_seconds:
+                        if isinstance(dur, Exception):
+                            dur = None
+
+                        if dur is None:
+                            st.unknown += 1
+                            status = "UNKNOWN"
+                        elif dur < self.s.threshold_seconds:
                             st.short += 1
                             if self.s.action == ActionMode.ANALYZE:
-                                self.row.emit(("SHORT", dur, p.name, str(p)))
+                                status = "SHORT"
                             else:
                                 try:
                                     self._delete(p)
                                     st.deleted += 1
-                                    self.row.emit(("DELETED", dur, p.name, str(p)))
+                                    status = "DELETED"
                                 except Exception:
                                     st.errors += 1
-                                    self.row.emit(("ERROR", dur, p.name, str(p)))
+                                    status = "ERROR"
                         else:
                             st.kept += 1
-                            self.row.emit(("KEEP", dur, p.name, str(p)))
-
-                    self.stats.emit(st)
-                    self.progress.emit(i, total)
-
-                self.finished.emit(st)
+                            status = "KEEP"
+
+                    batch.append((status, dur, p))
+                    now = time.monotonic()
+                    if len(batch) >= self.ROW_BATCH or now - last_flush >= self.ROW_INTERVAL:
+                        self.row_batch.emit(batch)
+                        self._emit_stats(st)
+                        self.status.emit(f"Found {st.found} files...")
+                        batch = []
+                        last_flush = now
+                        QThread.yieldCurrentThread()  # let the GUI thread take the batch
+                    progress.update(i, st.found)
+
+                if batch:
+                    self.row_batch.emit(batch)
+                self._emit_stats(st)
+                progress.flush(st.scanned, st.found)
+                self.status.emit("Canceled" if self._cancel.is_set() else f"Found {st.found} files")
 
             finally:
+                if discovered is not None:
+                    discovered.close()
+                if pool is not None:
+                    _shutdown_probe_pool(pool, workers)
+                self.cache.save()
                 pythoncom.CoUninitialize()
 
+            # Only after teardown: the page unlocks Start/Clear cache on this signal.
+            self.finished.emit()
+
         except Exception as e:
             self.failed.emit(str(e))
 
 
+class CleanerResultsModel(QAbstractTableModel):
+    HEADERS = ["Status", "Duration (s)", "File"]
+    _EMPHASIS = {"DELETED", "ERROR"}
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Column-wise storage; durations and file names are derived in data() on demand.
+        self._statuses: List[str] = []
+        self._durations: List[Optional[float]] = []
+        self._paths: List[str] = []
+        self._bold = QFont()
+        self._bold.setBold(True)
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._statuses, self._durations, self._paths = [], [], []
+        self.endResetModel()
+
+    def append_batch(self, rows: list) -> None:
+        if not rows:
+            return
+        first = len(self._statuses)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        for status, dur, fullpath in rows:
+            self._statuses.append(status)
+            self._durations.append(dur)
+            self._paths.append(fullpath)
+        self.endInsertRows()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._statuses)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return str(section + 1)
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        if column == 0:
+            keys = self._statuses
+        elif column == 1:
+            keys = [-1.0 if d is None else d for d in self._durations]  # unknown first
+        elif column == 2:
+            keys = [os.path.basename(p).casefold() for p in self._paths]
+        else:
+            return
+        perm = sorted(range(len(keys)), key=keys.__getitem__, reverse=(order == Qt.SortOrder.DescendingOrder))
+        self.beginResetModel()
+        self._statuses = [self._statuses[i] for i in perm]
+        self._durations = [self._durations[i] for i in perm]
+        self._paths = [self._paths[i] for i in perm]
+        self.endResetModel()
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row, col = index.row(), index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return self._statuses[row]
+            if col == 1:
+                dur = self._durations[row]
+                return "" if dur is None else f"{dur:.3f}"
+            return os.path.basename(self._paths[row])
+
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return self._paths[row]
+
+        if role == Qt.ItemDataRole.FontRole and col != 1 and self._statuses[row] in self._EMPHASIS:
+            return self._bold
+
+        return None
+
+
 class ShortVideoCleanerPage(QWidget):
-    def __init__(self, settings: QSettings):
+    def __init__(self, settings: QSettings, config: AppConfig):
         super().__init__()
         self.settings = settings
+        self.config = config
+        self._written = config.group("cleaner")
 
         self._thread: Optional[QThread] = None
         self._worker: Optional[CleanerWorker] = None
+        self.duration_cache = DurationCache(DurationCache.default_path())
 
-        self.model = QStandardItemModel(0, 3)
-        self.model.setHorizontalHeaderLabels(["Status", "Duration (s)", "File"])
+        self.model = CleanerResultsModel()
 
         self._build_ui()
         self._load()
@@ -1284,7 +2269,7 @@ class ShortVideoCleanerPage(QWidget):
         self.adv_toggle.setText("Advanced")
         self.adv_toggle.setCheckable(True)
         self.adv_toggle.setChecked(False)
-        self.adv_toggle.setToolTip("Show/hide advanced options (extensions and recursion).")
+        self.adv_toggle.setToolTip("Show/hide advanced options (extensions, recursion, size shortcut, cache).")
         outer.addWidget(self.adv_toggle, alignment=Qt.AlignmentFlag.AlignLeft)
 
         self.adv_box = QGroupBox("Advanced options")
@@ -1302,6 +2287,24 @@ class ShortVideoCleanerPage(QWidget):
         adv_l.addSpacing(12)
         adv_l.addWidget(self.recursive_chk)
 
+        self.fastpath = QDoubleSpinBox()
+        self.fastpath.setRange(0.0, 1000.0)
+        self.fastpath.setDecimals(1)
+        self.fastpath.setSuffix(" Mbit/s")
+        self.fastpath.setSpecialValueText("Off")
+        self.fastpath.setToolTip(
+            "Keep files without reading their duration when, to be shorter than the threshold,\n"
+            "they would need a higher bitrate than this. Off reads every file."
+        )
+        adv_l.addSpacing(12)
+        adv_l.addWidget(QLabel("Size shortcut:"))
+        adv_l.addWidget(self.fastpath)
+
+        self.btn_clear_cache = QPushButton("Clear duration cache")
+        self.btn_clear_cache.setToolTip("Durations are remembered per file (until it changes). Forget them all.")
+        adv_l.addSpacing(12)
+        adv_l.addWidget(self.btn_clear_cache)
+
         self.adv_box.setVisible(False)
         outer.addWidget(self.adv_box)
 
@@ -1351,12 +2354,14 @@ class ShortVideoCleanerPage(QWidget):
         self.btn_start.clicked.connect(self.on_start)
         self.btn_cancel.clicked.connect(self.on_cancel)
         self.btn_clear.clicked.connect(self.on_clear)
+        self.btn_clear_cache.clicked.connect(self.on_clear_cache)
 
         self.path_edit.textChanged.connect(self.refresh_ui)
         self.threshold.valueChanged.connect(self.refresh_ui)
         self.action.currentIndexChanged.connect(self.refresh_ui)
         self.ext_edit.textChanged.connect(self.refresh_ui)
         self.recursive_chk.stateChanged.connect(self.refresh_ui)
+        self.fastpath.valueChanged.connect(self.refresh_ui)
 
         self.adv_toggle.toggled.connect(self.on_toggle_advanced)
 
@@ -1364,21 +2369,25 @@ class ShortVideoCleanerPage(QWidget):
         self.setAcceptDrops(True)
 
     def _load(self) -> None:
-        self.path_edit.setText(self.settings.value("cleaner/dir", "", type=str))
-        self.threshold.setValue(float(self.settings.value("cleaner/threshold", 3.0, type=float)))
-        self.ext_edit.setText(self.settings.value("cleaner/exts", DEFAULT_EXTS, type=str))
-        self.recursive_chk.setChecked(self.settings.value("cleaner/recursive", True, type=bool))
-        action = self.settings.value("cleaner/action", ActionMode.ANALYZE.value, type=str)
-        idx = self.action.findText(action)
+        c = self.config
+        self.path_edit.setText(c.cleaner_dir)
+        self.threshold.setValue(c.cleaner_threshold)
+        self.ext_edit.setText(c.cleaner_exts)
+        self.recursive_chk.setChecked(c.cleaner_recursive)
+        self.fastpath.setValue(c.cleaner_fastpath_mbps)
+        idx = self.action.findText(c.cleaner_action)
         if idx >= 0:
             self.action.setCurrentIndex(idx)
 
     def _save(self) -> None:
-        self.settings.setValue("cleaner/dir", self.path_edit.text().strip())
-        self.settings.setValue("cleaner/threshold", float(self.threshold.value()))
-        self.settings.setValue("cleaner/exts", self.ext_edit.text())
-        self.settings.setValue("cleaner/recursive", self.recursive_chk.isChecked())
-        self.settings.setValue("cleaner/action", str(self.action.currentText()))
+        write_settings_group(self.settings, "cleaner", {
+            "dir": self.path_edit.text().strip(),
+            "threshold": float(self.threshold.value()),
+            "exts": self.ext_edit.text(),
+            "recursive": self.recursive_chk.isChecked(),
+            "action": str(self.action.currentText()),
+            "fastpath_mbps": float(self.fastpath.value()),
+        }, self._written)
 
     def on_toggle_advanced(self, checked: bool) -> None:
         self.adv_box.setVisible(checked)
@@ -1435,11 +2444,15 @@ class ShortVideoCleanerPage(QWidget):
             QMessageBox.critical(self, "Error", f"Could not open folder:\n{e!r}")
 
     def on_clear(self) -> None:
-        self.model.removeRows(0, self.model.rowCount())
+        self.model.clear()
         self.progress.setValue(0)
         self.stats_lbl.setText("Ready.")
         self.status_lbl.setText("")
 
+    def on_clear_cache(self) -> None:
+        self.duration_cache.clear()
+        self.status_lbl.setText("Duration cache cleared.")
+
     def build_settings_or_error(self) -> Optional[CleanerSettings]:
         directory = self.selected_dir()
         if directory is None:
@@ -1478,11 +2491,12 @@ class ShortVideoCleanerPage(QWidget):
                 return None
 
         return CleanerSettings(
-            directory=directory,
+            directory=os.fspath(directory),
             recursive=self.recursive_chk.isChecked(),
             threshold_seconds=float(self.threshold.value()),
             extensions=exts,
             action=action,
+            size_fastpath_mbps=float(self.fastpath.value()),
         )
 
     def lock_ui(self, locked: bool) -> None:
@@ -1496,6 +2510,8 @@ class ShortVideoCleanerPage(QWidget):
         self.adv_toggle.setEnabled(not locked)
         self.ext_edit.setEnabled(not locked)
         self.recursive_chk.setEnabled(not locked)
+        self.fastpath.setEnabled(not locked)
+        self.btn_clear_cache.setEnabled(not locked)
 
         self.btn_start.setEnabled((self.selected_dir() is not None) and not locked)
         self.btn_cancel.setEnabled(locked)
@@ -1511,22 +2527,24 @@ class ShortVideoCleanerPage(QWidget):
         self.status_lbl.setText("Scanning...")
 
         self._thread = QThread()
-        self._worker = CleanerWorker(s)
+        self._worker = CleanerWorker(s, self.duration_cache)
         self._worker.moveToThread(self._thread)
 
         self._thread.started.connect(self._worker.run)
         self._worker.progress.connect(self.on_worker_progress)
         self._worker.status.connect(self.on_worker_status)
         self._worker.stats.connect(self.on_worker_stats)
-        self._worker.row.connect(self.on_worker_row)
+        self._worker.row_batch.connect(self.on_worker_rows)
         self._worker.finished.connect(self.on_worker_finished)
         self._worker.failed.connect(self.on_worker_failed)
 
         self._worker.finished.connect(self._thread.quit)
         self._worker.failed.connect(self._thread.quit)
-        self._thread.finished.connect(self._thread.deleteLater)
+        self._thread.finished.connect(self.on_thread_finished)
 
         self._thread.start()
+        # Below the GUI thread, so scrolling and Cancel stay responsive during long scans.
+        self._thread.setPriority(QThread.Priority.LowPriority)
 
     def on_cancel(self) -> None:
         if self._worker:
@@ -1541,48 +2559,28 @@ class ShortVideoCleanerPage(QWidget):
     def on_worker_status(self, msg: str) -> None:
         self.status_lbl.setText(msg)
 
-    def on_worker_stats(self, st_obj: object) -> None:
-        if not isinstance(st_obj, CleanerStats):
-            return
+    def on_worker_stats(
+        self, found: int, scanned: int, short: int, deleted: int, kept: int, unknown: int, errors: int
+    ) -> None:
         self.stats_lbl.setText(
-            f"Found={st_obj.found}  Scanned={st_obj.scanned}  Short={st_obj.short}  "
-            f"Deleted={st_obj.deleted}  Unknown={st_obj.unknown}  Errors={st_obj.errors}"
+            f"Found={found}  Scanned={scanned}  Short={short}  "
+            f"Deleted={deleted}  Unknown={unknown}  Errors={errors}"
         )
 
-    def on_worker_row(self, row_obj: object) -> None:
-        if not isinstance(row_obj, tuple) or len(row_obj) != 4:
-            return
-
-        status, dur, filename, fullpath = row_obj
-
-        font_emphasis = QFont()
-        font_emphasis.setBold(True)
-
-        it_status = QStandardItem(str(status))
-        it_dur = QStandardItem("" if dur is None else f"{float(dur):.3f}")
-        it_file = QStandardItem(str(filename))
-
-        tooltip = str(fullpath)
-        for it in (it_status, it_dur, it_file):
-            it.setToolTip(tooltip)
-
-        s = str(status).upper()
-        if s in {"DELETED", "ERROR"}:
-            it_status.setFont(font_emphasis)
-            it_file.setFont(font_emphasis)
+    def on_worker_rows(self, rows: list) -> None:
+        self.model.append_batch(rows)
 
-        self.model.appendRow([it_status, it_dur, it_file])
-
-    def on_worker_finished(self, st_obj: object) -> None:
+    def on_worker_finished(self) -> None:
         self.status_lbl.setText("Done.")
-        self._worker = None
-        self._thread = None
-        self.lock_ui(False)
-        self.refresh_ui()
 
     def on_worker_failed(self, msg: str) -> None:
-        QMessageBox.critical(self, "Error", msg)
         self.status_lbl.setText("Error.")
+        QMessageBox.critical(self, "Error", msg)
+
+    def on_thread_finished(self) -> None:
+        # The page holds the only references; drop them once the thread has really stopped.
+        if self._thread is not None:
+            self._thread.wait()
         self._worker = None
         self._thread = None
         self.lock_ui(False)
@@ -1601,6 +2599,59 @@ class ShortVideoCleanerPage(QWidget):
                 self.path_edit.setText(str(p))
 
 
+# =========================
+# App settings
+# =========================
+@dataclass(frozen=True, slots=True)
+class AppConfig:
+    """
+    Snapshot of all persisted settings, read from QSettings once at startup.
+    Field names map to keys as <group>_<key> -> "<group>/<key>".
+    """
+    sort_source: str = ""
+    sort_output: str = ""
+    sort_dry: bool = False
+    sort_lower: bool = True
+    sort_recursive: bool = False
+    sort_remember: bool = True
+    sort_dup: str = "auto_rename"
+    sort_mode: str = SortMode.ORIENTATION.value
+    cleaner_dir: str = ""
+    cleaner_threshold: float = 3.0
+    cleaner_exts: str = DEFAULT_EXTS
+    cleaner_recursive: bool = True
+    cleaner_action: str = ActionMode.ANALYZE.value
+    cleaner_fastpath_mbps: float = 0.0
+
+    @classmethod
+    def load(cls, settings: QSettings) -> AppConfig:
+        values = {}
+        for f in fields(cls):
+            key = f.name.replace("_", "/", 1)
+            values[f.name] = settings.value(key, f.default, type=type(f.default))
+        return cls(**values)
+
+    def group(self, name: str) -> Dict[str, object]:
+        prefix = name + "_"
+        return {f.name[len(prefix):]: getattr(self, f.name) for f in fields(self) if f.name.startswith(prefix)}
+
+
+def write_settings_group(settings: QSettings, group: str, values: Dict[str, object], written: Dict[str, object]) -> None:
+    """
+    Writes the keys whose value differs from `written` (last persisted state) in one group batch.
+    """
+    changed = {k: v for k, v in values.items() if written.get(k) != v}
+    if not changed:
+        return
+    settings.beginGroup(group)
+    try:
+        for k, v in changed.items():
+            settings.setValue(k, v)
+    finally:
+        settings.endGroup()
+    written.update(changed)
+
+
 # =========================
 # Main Window (Navigation)
 # =========================
@@ -1617,6 +2668,7 @@ class MediaFlowMainWindow(QMainWindow):
             pass
 
         self.settings = QSettings(APP_ORG, APP_SETTINGS)
+        self.config = AppConfig.load(self.settings)
 
         root = QWidget()
         self.setCentralWidget(root)
@@ -1658,8 +2710,8 @@ class MediaFlowMainWindow(QMainWindow):
         self.container_layout.setContentsMargins(0, 0, 0, 0)
         content_layout.addWidget(self.container, 1)
 
-        self.page_sort = SortMediaPage(self.settings)
-        self.page_clean = ShortVideoCleanerPage(self.settings)
+        self.page_sort = SortMediaPage(self.settings, self.config)
+        self.page_clean = ShortVideoCleanerPage(self.settings, self.config)
 
         self._current: Optional[QWidget] = None
 
@@ -1691,7 +2743,7 @@ class MediaFlowMainWindow(QMainWindow):
     def closeEvent(self, event):
         # graceful cancel if needed
         try:
-            if self.page_sort.thread is not None:
+            if self.page_sort.is_running():
                 self.page_sort.cancel_event.set()
         except Exception:
             pass